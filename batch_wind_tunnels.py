@@ -0,0 +1,184 @@
+"""Batch submission of WindTunnel scenarios based on Inductiva API.
+
+This script submits a batch of wind tunnel simulations for a set of
+objects, with the airflow velocity of each simulation sampled at
+random within the configured ranges. All simulations are submitted in
+a single batch via `WindTunnelScenario.simulate_batch` or, when
+`--max_workers` is larger than 1, concurrently from a thread pool so
+that the upload of one simulation overlaps with the others.
+"""
+import concurrent.futures
+import functools
+import hashlib
+import json
+import os
+
+from absl import app
+from absl import flags
+from absl import logging
+import numpy as np
+
+from lib import models
+from lib import scenarios
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_string("objects_dir", "assets",
+                    "Directory with the object files to simulate.")
+flags.DEFINE_integer("num_simulations_per_object", 1,
+                     "Number of simulations to run per object.")
+flags.DEFINE_multi_float(
+    "flow_velocity_range_x", [20, 50],
+    "Range of the x-component of the flow velocity (in m/s), passed as "
+    "two occurrences of the flag: lower bound then upper bound.")
+flags.DEFINE_multi_float(
+    "flow_velocity_range_y", [0, 0],
+    "Range of the y-component of the flow velocity (in m/s), passed as "
+    "two occurrences of the flag: lower bound then upper bound.")
+flags.DEFINE_multi_float(
+    "flow_velocity_range_z", [0, 0],
+    "Range of the z-component of the flow velocity (in m/s), passed as "
+    "two occurrences of the flag: lower bound then upper bound.")
+for range_flag in ("flow_velocity_range_x", "flow_velocity_range_y",
+                   "flow_velocity_range_z"):
+    flags.register_validator(
+        range_flag,
+        lambda values: len(values) == 2,
+        message="Flag must be passed exactly two values: the lower and the "
+        "upper bound of the range.")
+
+flags.DEFINE_integer("num_iterations", 100,
+                     "Number of iterations of the solver.")
+flags.DEFINE_integer("resolution", 2, "Resolution level of the mesh.")
+flags.DEFINE_integer(
+    "max_workers", 1,
+    "Number of threads used to submit simulations concurrently.")
+flags.DEFINE_string(
+    "task_metadata_path", "task_metadata.jsonl",
+    "Path of the JSONL file where the metadata of the submitted tasks "
+    "is saved.")
+
+
+def get_object_paths(objects_dir):
+    """Lists the paths of the object files in a directory.
+
+    Uses `os.scandir` so the joined path and the cached stat of each
+    entry come from a single directory pass.
+    """
+
+    with os.scandir(objects_dir) as entries:
+        return sorted(entry.path
+                      for entry in entries
+                      if entry.is_file() and entry.name.endswith(".obj"))
+
+
+def deduplicate_object_paths(object_paths):
+    """Maps object files with identical contents to one canonical path.
+
+    Generated datasets often contain byte-identical meshes under
+    different names. Hashing each file once lets every duplicate
+    reference the first copy, so the staging links (and the OS page
+    cache during upload) converge on a single file per distinct mesh.
+    """
+
+    canonical_paths = {}
+    deduplicated = []
+
+    for object_path in object_paths:
+        with open(object_path, "rb") as object_file:
+            digest = hashlib.file_digest(object_file, "sha256").hexdigest()
+        deduplicated.append(canonical_paths.setdefault(digest, object_path))
+
+    num_duplicates = len(deduplicated) - len(canonical_paths)
+    if num_duplicates:
+        logging.info("Mapped %d duplicate objects to %d distinct meshes.",
+                     num_duplicates, len(canonical_paths))
+
+    return deduplicated
+
+
+def run_simulation(pool, object_path, wind_tunnel, sim_params):
+    """Submits a single wind tunnel simulation with a pooled scenario.
+
+    The pool hands each submission an exclusively-owned scenario, so
+    the underlying `FileManager` state is never shared across threads.
+    """
+
+    with pool.acquire() as scenario:
+        scenario.wind_tunnel = wind_tunnel
+        return scenario.simulate(object_path=object_path, sim_params=sim_params)
+
+
+def main(_):
+    object_paths = get_object_paths(FLAGS.objects_dir)
+    if not object_paths:
+        logging.error("No .obj files found in %s: nothing to submit.",
+                      FLAGS.objects_dir)
+        return
+    logging.info("Found %d objects in %s.", len(object_paths),
+                 FLAGS.objects_dir)
+
+    object_paths = deduplicate_object_paths(object_paths)
+
+    sim_params = scenarios.SimulationParameters(
+        num_iterations=FLAGS.num_iterations, resolution=FLAGS.resolution)
+
+    batch_object_paths = [
+        object_path for object_path in object_paths
+        for _ in range(FLAGS.num_simulations_per_object)
+    ]
+
+    # Sample the flow velocities of the whole batch in a single
+    # vectorized call instead of three scalar draws per simulation.
+    rng = np.random.default_rng()
+    low = np.array([
+        FLAGS.flow_velocity_range_x[0],
+        FLAGS.flow_velocity_range_y[0],
+        FLAGS.flow_velocity_range_z[0],
+    ])
+    high = np.array([
+        FLAGS.flow_velocity_range_x[1],
+        FLAGS.flow_velocity_range_y[1],
+        FLAGS.flow_velocity_range_z[1],
+    ])
+    flow_velocities = rng.uniform(low, high, size=(len(batch_object_paths), 3))
+
+    wind_tunnels = [
+        models.WindTunnel(flow_velocity=tuple(flow_velocity))
+        for flow_velocity in flow_velocities.tolist()
+    ]
+
+    if FLAGS.max_workers > 1:
+        pool = scenarios.ScenarioPool(
+            size=min(FLAGS.max_workers, len(batch_object_paths)))
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=FLAGS.max_workers) as executor:
+            tasks = list(
+                executor.map(functools.partial(run_simulation, pool),
+                             batch_object_paths, wind_tunnels,
+                             [sim_params] * len(batch_object_paths)))
+    else:
+        scenario = scenarios.WindTunnelScenario(wind_tunnel=wind_tunnels[0])
+        tasks = scenario.simulate_batch(object_paths=batch_object_paths,
+                                        sim_params_list=[sim_params] *
+                                        len(batch_object_paths),
+                                        wind_tunnels=wind_tunnels)
+
+    logging.info("Submitted %d simulations.", len(tasks))
+
+    with open(FLAGS.task_metadata_path, "w", encoding="utf-8") as json_file:
+        for task, object_path, wind_tunnel in zip(tasks, batch_object_paths,
+                                                  wind_tunnels):
+            json.dump(
+                {
+                    "task_id": task.id,
+                    "object_path": object_path,
+                    "flow_velocity": wind_tunnel.flow_velocity,
+                }, json_file)
+            json_file.write("\n")
+
+    logging.info("Saved the task metadata to %s.", FLAGS.task_metadata_path)
+
+
+if __name__ == "__main__":
+    app.run(main)
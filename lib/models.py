@@ -1,8 +1,7 @@
 """Model of the virtual Wind Tunnel."""
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Tuple
-import numpy as np
 
 
 @dataclass
@@ -18,8 +17,11 @@ class WindTunnel:
     z_max: float = 8
 
     def __post_init__(self):
-        # Airflow velocity magnitude must be less than 100m/s
-        assert np.linalg.norm(self.flow_velocity) < 100
+        # Airflow velocity magnitude must be less than 100m/s.
+        # Compare squared magnitudes: no numpy array round-trip and no
+        # sqrt for three scalars.
+        v_x, v_y, v_z = self.flow_velocity
+        assert v_x**2 + v_y**2 + v_z**2 < 100**2
 
         assert self.x_min < self.x_max
         assert self.y_min < self.y_max
@@ -27,4 +29,14 @@ class WindTunnel:
 
     def to_dict(self):
         """Converts the object to a dictionary."""
-        return asdict(self)
+        # Hand-rolled instead of dataclasses.asdict, which recurses and
+        # deep-copies every field on each call.
+        return {
+            "flow_velocity": self.flow_velocity,
+            "x_min": self.x_min,
+            "x_max": self.x_max,
+            "y_min": self.y_min,
+            "y_max": self.y_max,
+            "z_min": self.z_min,
+            "z_max": self.z_max,
+        }
@@ -27,16 +27,55 @@ Currently, the following variables are fixed:
 pressure_field, cutting planes and force coefficients.
 """
 
+import concurrent.futures
+import contextlib
+import functools
 import os
-from typing import Optional
-from dataclasses import dataclass, asdict
+import queue
+import shutil
+import threading
+from typing import List, Optional
+from dataclasses import dataclass
 
+import jinja2
 from inductiva import mixins, resources, simulators
 
 from .models import WindTunnel
 
 SCENARIO_TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
 
+TEMPLATE_EXTENSION = ".jinja"
+
+# The client's FileManager.set_root_dir globs for a free directory name
+# and then creates it, which races when called from several threads.
+_SET_ROOT_DIR_LOCK = threading.Lock()
+
+
+@functools.lru_cache()
+def _get_template_environment(template_dir: str) -> jinja2.Environment:
+    """Returns the jinja2 environment of a template directory.
+
+    The environment is cached per template directory and keeps the
+    compiled templates in memory, so repeated renders of the same
+    directory skip re-parsing the template files.
+    """
+    return jinja2.Environment(loader=jinja2.FileSystemLoader(template_dir),
+                              undefined=jinja2.StrictUndefined,
+                              auto_reload=False)
+
+
+@functools.lru_cache()
+def _get_simulator() -> simulators.OpenFOAM:
+    """Returns a process-wide OpenFOAM simulator.
+
+    The simulator object is stateless in the inductiva client — each
+    submission opens its own API connection — so sharing one instance
+    only avoids re-instantiating it per simulation. Keeping the HTTP
+    session alive across submissions would have to happen inside the
+    client and is not reachable from this repo.
+    """
+    return simulators.OpenFOAM()
+
 
 @dataclass
 class SimulationParameters:
@@ -47,7 +86,10 @@ class SimulationParameters:
 
     def to_dict(self):
         """Returns a dictionary representation of the simulation parameters."""
-        return asdict(self)
+        return {
+            "num_iterations": self.num_iterations,
+            "resolution": self.resolution,
+        }
 
 
 class WindTunnelScenario(mixins.FileManager):
@@ -55,13 +97,18 @@ class WindTunnelScenario(mixins.FileManager):
 
     SCENARIO_DIR = "wind_tunnel_input"
 
-    def __init__(self, wind_tunnel: WindTunnel):
+    def __init__(self, wind_tunnel: WindTunnel, reuse_root_dir: bool = False):
         """Initializes the `WindTunnel` conditions.
 
         Args:
             wind_tunnel: Wind tunnel model.
+            reuse_root_dir: Keep the same scratch directory across
+                simulations, re-staging only the parameter-dependent
+                files. Used by `ScenarioPool`.
         """
         self.wind_tunnel = wind_tunnel
+        self.reuse_root_dir = reuse_root_dir
+        self._root_dir_staged = False
 
     def get_commands(self):
 
@@ -91,14 +138,223 @@ class WindTunnelScenario(mixins.FileManager):
             on: The machine group to use for the simulation.
         """
 
-        self.set_root_dir(self.SCENARIO_DIR)
-        # add dir first to create the input directory structure from templates
-        self.add_dir(SCENARIO_TEMPLATE_DIR, **sim_params.to_dict(),
-                     **self.wind_tunnel.to_dict())
-        self.add_file(object_path, "constant/triSurface/object.obj")
+        input_dir = self._setup_input_dir(object_path, sim_params,
+                                          self.wind_tunnel)
 
-        task = simulators.OpenFOAM().run(input_dir=self.get_root_dir(),
-                                         on=on,
-                                         commands=self.get_commands())
+        task = _get_simulator().run(input_dir=input_dir,
+                                    on=on,
+                                    commands=self.get_commands())
 
         return task
+
+    def simulate_batch(
+        self,
+        object_paths: List[str],
+        sim_params_list: Optional[List[SimulationParameters]] = None,
+        wind_tunnels: Optional[List[WindTunnel]] = None,
+        on: Optional[resources.MachineGroup] = None,
+    ):
+        """Simulates a batch of wind tunnel scenarios.
+
+        Staging and submission are pipelined: while the inputs of one
+        simulation upload, the input directory of the next one is
+        staged by a background thread (double-buffering), so disk and
+        network work overlap instead of alternating.
+
+        Args:
+            object_paths: Paths to the objects inserted in the wind
+                tunnel, one per simulation.
+            sim_params_list: Simulation-specific configuration parameters,
+                one per simulation. Defaults to `SimulationParameters()`
+                for all simulations.
+            wind_tunnels: Wind tunnel models, one per simulation. Defaults
+                to the wind tunnel of the scenario.
+            on: The machine group to use for the simulations.
+
+        Returns:
+            List of tasks, one per simulation.
+        """
+
+        num_simulations = len(object_paths)
+        if num_simulations == 0:
+            return []
+
+        if sim_params_list is None:
+            sim_params_list = [SimulationParameters()] * num_simulations
+        if wind_tunnels is None:
+            wind_tunnels = [self.wind_tunnel] * num_simulations
+
+        simulator = _get_simulator()
+        commands = self.get_commands()
+        tasks = []
+
+        # The single worker serializes all staging calls, so the
+        # FileManager state is only ever touched by one thread at a time.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            next_input_dir = executor.submit(self._setup_input_dir,
+                                             object_paths[0],
+                                             sim_params_list[0],
+                                             wind_tunnels[0])
+
+            for index in range(num_simulations):
+                input_dir = next_input_dir.result()
+
+                if index + 1 < num_simulations:
+                    next_input_dir = executor.submit(self._setup_input_dir,
+                                                     object_paths[index + 1],
+                                                     sim_params_list[index + 1],
+                                                     wind_tunnels[index + 1])
+
+                tasks.append(
+                    simulator.run(input_dir=input_dir, on=on,
+                                  commands=commands))
+
+        return tasks
+
+    def _setup_input_dir(self, object_path: str,
+                         sim_params: SimulationParameters,
+                         wind_tunnel: WindTunnel):
+        """Creates the input directory of a single simulation."""
+
+        if not (self.reuse_root_dir and self._root_dir_staged):
+            self.stage_root_dir()
+
+        self._render_templates(**sim_params.to_dict(), **wind_tunnel.to_dict())
+        self.add_file_ref(object_path, "constant/triSurface/object.obj")
+
+        return self.get_root_dir()
+
+    def stage_root_dir(self):
+        """Allocates the scratch directory and stages the static files.
+
+        Called lazily on the first simulation, or upfront by
+        `ScenarioPool`, whose slots must be staged from a single thread
+        because the client's `set_root_dir` is not thread-safe.
+        """
+
+        with _SET_ROOT_DIR_LOCK:
+            self.set_root_dir(self.SCENARIO_DIR)
+        # stage the static files first to create the input directory
+        # structure from templates
+        self._stage_static_files()
+        self._root_dir_staged = True
+
+    def add_file_ref(self, src_path: str, dst_path: str):
+        """Adds a file to the root dir by reference instead of copying.
+
+        Creates a symlink to `src_path`, falling back to a hardlink and
+        finally to a plain copy, so large object meshes are not
+        duplicated into every per-simulation input directory.
+
+        Args:
+            src_path: Path to the referenced file.
+            dst_path: Destination path, relative to the root dir.
+        """
+
+        abs_src_path = os.path.abspath(src_path)
+        abs_dst_path = os.path.join(self.get_root_dir(), dst_path)
+        os.makedirs(os.path.dirname(abs_dst_path), exist_ok=True)
+
+        # a reused root dir still references the previous object
+        if os.path.lexists(abs_dst_path):
+            os.remove(abs_dst_path)
+
+        try:
+            os.symlink(abs_src_path, abs_dst_path)
+        except OSError:
+            try:
+                os.link(abs_src_path, abs_dst_path)
+            except OSError:
+                shutil.copy(abs_src_path, abs_dst_path)
+
+    def _stage_static_files(self):
+        """Copies the parameter-independent template files into the root dir.
+
+        Files without the `.jinja` extension do not depend on the
+        simulation parameters and are copied as-is. When the root dir
+        is reused, this staging happens only once per scratch directory.
+        """
+
+        root_dir = self.get_root_dir()
+
+        for dirpath, _, filenames in os.walk(SCENARIO_TEMPLATE_DIR):
+            relpath = os.path.relpath(dirpath, SCENARIO_TEMPLATE_DIR)
+            dest_dir = os.path.join(root_dir, relpath)
+            os.makedirs(dest_dir, exist_ok=True)
+
+            for filename in filenames:
+                if filename.endswith(TEMPLATE_EXTENSION):
+                    continue
+                shutil.copy(os.path.join(dirpath, filename),
+                            os.path.join(dest_dir, filename))
+
+    def _render_templates(self, **params):
+        """Renders the parameter-dependent template files into the root dir.
+
+        Template files are rendered with the compiled templates cached
+        in the jinja2 environment, so only the parameter-dependent
+        files pay the render cost on every simulation of a batch.
+        """
+
+        environment = _get_template_environment(SCENARIO_TEMPLATE_DIR)
+        root_dir = self.get_root_dir()
+
+        for dirpath, _, filenames in os.walk(SCENARIO_TEMPLATE_DIR):
+            relpath = os.path.relpath(dirpath, SCENARIO_TEMPLATE_DIR)
+
+            for filename in filenames:
+                if not filename.endswith(TEMPLATE_EXTENSION):
+                    continue
+
+                template_name = os.path.normpath(os.path.join(
+                    relpath, filename)).replace(os.sep, "/")
+                template = environment.get_template(template_name)
+                dest_path = os.path.join(root_dir, relpath,
+                                         filename[:-len(TEMPLATE_EXTENSION)])
+                with open(dest_path, "w", encoding="utf-8") as dest_file:
+                    dest_file.write(template.render(**params))
+
+
+class ScenarioPool:
+    """Pool of reusable `WindTunnelScenario` objects.
+
+    Each pooled scenario keeps its scratch directory across
+    simulations: the parameter-independent files are staged once per
+    slot and only the rendered templates and the object mesh are
+    replaced per run, amortizing the filesystem setup cost of the
+    input directories across a batch.
+    """
+
+    def __init__(self, size: int, wind_tunnel: Optional[WindTunnel] = None):
+        """Initializes the pool.
+
+        Args:
+            size: Number of scenarios kept in the pool.
+            wind_tunnel: Default wind tunnel of the pooled scenarios.
+        """
+        if wind_tunnel is None:
+            wind_tunnel = WindTunnel()
+
+        self._free_scenarios = queue.Queue()
+        for _ in range(size):
+            scenario = WindTunnelScenario(wind_tunnel=wind_tunnel,
+                                          reuse_root_dir=True)
+            # Stage every slot here, before any worker thread runs:
+            # the client's set_root_dir is not thread-safe, so no
+            # worker may be the first user of a slot.
+            scenario.stage_root_dir()
+            self._free_scenarios.put(scenario)
+
+    @contextlib.contextmanager
+    def acquire(self):
+        """Yields a scenario from the pool, returning it on exit.
+
+        Blocks until a scenario becomes available. The scenario is
+        owned exclusively by the caller for the duration of the `with`
+        block.
+        """
+        scenario = self._free_scenarios.get()
+        try:
+            yield scenario
+        finally:
+            self._free_scenarios.put(scenario)
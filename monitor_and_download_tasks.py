@@ -0,0 +1,89 @@
+"""Monitor submitted wind tunnel tasks and download their outputs.
+
+This script reads the metadata file written by `batch_wind_tunnels.py`
+and polls the status of every task until it reaches a terminal state.
+Tasks are monitored concurrently from a thread pool, so the status
+round-trips of independent tasks overlap, and the outputs of each
+successful task are downloaded as soon as it finishes instead of
+waiting for the whole batch.
+"""
+import concurrent.futures
+import time
+
+from absl import app
+from absl import flags
+from absl import logging
+import inductiva
+import orjson
+
+FLAGS = flags.FLAGS
+
+flags.DEFINE_string(
+    "task_metadata_path", "task_metadata.jsonl",
+    "Path of the JSONL file with the metadata of the submitted tasks.")
+flags.DEFINE_integer(
+    "max_workers", 16,
+    "Number of threads used to poll statuses and download outputs "
+    "concurrently.")
+flags.DEFINE_integer("poll_interval", 30,
+                     "Time (in seconds) between two status polls of a task.")
+
+
+def get_task_ids(task_metadata_path):
+    """Reads the ids of the submitted tasks from the metadata file.
+
+    The file is streamed line by line instead of being materialized
+    with `readlines`, and each record is parsed with `orjson`.
+    """
+
+    with open(task_metadata_path, "rb") as json_file:
+        return [orjson.loads(line)["task_id"] for line in json_file]
+
+
+def monitor_task(task_id, poll_interval):
+    """Polls a task until it terminates and downloads its outputs.
+
+    Args:
+        task_id: Id of the task to monitor.
+        poll_interval: Time (in seconds) between two status polls.
+
+    Returns:
+        The terminal status of the task.
+    """
+
+    task = inductiva.tasks.Task(task_id)
+
+    # The client owns the set of terminal statuses; duplicating it here
+    # would drift as new ones (e.g. spot preemption) are added.
+    status = task.get_status()
+    while status not in task.TERMINAL_STATUSES:
+        time.sleep(poll_interval)
+        status = task.get_status()
+
+    if status == "success":
+        output_dir = task.download_outputs()
+        logging.info("Task %s finished: outputs downloaded to %s.", task_id,
+                     output_dir)
+    else:
+        logging.warning("Task %s finished with status \"%s\".", task_id, status)
+
+    return status
+
+
+def main(_):
+    task_ids = get_task_ids(FLAGS.task_metadata_path)
+    logging.info("Monitoring %d tasks.", len(task_ids))
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=FLAGS.max_workers) as executor:
+        statuses = list(
+            executor.map(monitor_task, task_ids,
+                         [FLAGS.poll_interval] * len(task_ids)))
+
+    num_successes = statuses.count("success")
+    logging.info("%d out of %d tasks finished with success.", num_successes,
+                 len(statuses))
+
+
+if __name__ == "__main__":
+    app.run(main)